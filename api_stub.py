@@ -1,23 +1,50 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict
+import hashlib
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Optional
 
 app = FastAPI()
-db: Dict[str, dict] = {}
 
 class Dataset(BaseModel):
+    # Frozen because db hands the same instance to every reader.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     description: str
 
-@app.post("/datasets")
+# Stores the already-validated request models, so reads never rebuild them.
+db: Dict[str, Dataset] = {}
+
+def _etag(dataset: Dataset) -> str:
+    digest = hashlib.blake2b(f"{dataset.name}:{dataset.description}".encode(), digest_size=8)
+    return f"\"{digest.hexdigest()}\""
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison and may be "*" or a comma-separated list.
+    if if_none_match is None:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+@app.post("/datasets", response_model=Dataset)
 def create_dataset(dataset: Dataset):
     if dataset.name in db:
         raise HTTPException(status_code=400, detail="Dataset already exists")
-    db[dataset.name] = dataset.dict()
+    db[dataset.name] = dataset
     return dataset
 
-@app.get("/datasets/{name}")
-def get_dataset(name: str):
+@app.get("/datasets/{name}", response_model=Dataset)
+def get_dataset(name: str, request: Request, response: Response):
     if name not in db:
         raise HTTPException(status_code=404, detail="Not found")
-    return db[name]
+    dataset = db[name]
+    etag = _etag(dataset)
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return dataset
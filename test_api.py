@@ -23,10 +23,38 @@ def test_get_dataset():
     assert response.status_code == 200
     assert response.json()["description"] == "Test"
 
+def test_get_dataset_cache_headers():
+    client.post("/datasets", json={"name": "Cached", "description": "Test"})
+    response = client.get("/datasets/Cached")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, max-age=30"
+    assert response.headers["ETag"].startswith('"')
+
+@pytest.mark.parametrize("if_none_match,expected_status", [
+    ("{etag}", 304),
+    ("W/{etag}", 304),  # weak form, e.g. rewritten by a gzip proxy
+    ('"other", {etag}', 304),
+    ("*", 304),
+    ('"other"', 200),
+])
+def test_get_dataset_if_none_match(if_none_match, expected_status):
+    client.post("/datasets", json={"name": "Cached", "description": "Test"})
+    etag = client.get("/datasets/Cached").headers["ETag"]
+    response = client.get("/datasets/Cached", headers={"If-None-Match": if_none_match.format(etag=etag)})
+    assert response.status_code == expected_status
+    if expected_status == 304:
+        # Revalidation echoes the ETag without resending the body
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
 def test_missing_dataset():
     response = client.get("/datasets/Missing")
     assert response.status_code == 404
 
 def test_invalid_payload():
     response = client.post("/datasets", json={"description": "No name field"})
+    assert response.status_code == 422
+
+def test_unknown_field_rejected():
+    response = client.post("/datasets", json={"name": "Test", "description": "Test", "owner": "me"})
     assert response.status_code == 422
\ No newline at end of file